@@ -9,39 +9,58 @@ This bot automates the process of curating, formatting, and publishing domain-sp
 Key Components:
 ---------------
 1. **Environment Configuration**:
-   - Reads API credentials and Telegram details from `.env` via `dotenv`.
+   - Reads API credentials and Telegram details from `.env` via `dotenv` into a frozen `Env`
+     dataclass, built once per process and shared by every bot instance.
    - Validates required Twitter (X) and Grok credentials are present.
 
-2. **Thread-Safe JSON Cache**:
+2. **SQLite Key/Value Cache**:
    - Caches both Grok responses and posted tweets/messages to prevent redundant requests.
-   - Uses a reentrant lock (`RLock`) to ensure thread-safe read/write operations to `tweet_cache.json`.
+   - Entries live in a single `kv` table in `tweet_cache.sqlite` (WAL mode), so each write is one
+     indexed `INSERT OR REPLACE` instead of a full-file rewrite.
+   - Values are compact JSON serialised with `orjson`; larger ones (e.g. Grok replies) are stored zstd-compressed.
+   - Keys are short content hashes (`tweet:<blake3[:16]>`) rather than the full tweet/prompt text.
+   - A legacy `tweet_cache.json` is imported once on first start.
+   - Lookups are served from an in-memory dict split into 16 lock-striped shards. Writes made during
+     a broadcast are buffered and handed over once it finishes; a daemon flusher thread persists each
+     batch in a single transaction, so the posting path never waits on disk I/O.
 
 3. **Grok Prompting (LLM Client)**:
-   - A detailed `meta_prompt` is used to instruct Grok to return a Python dictionary containing 280-character tweet-sized responses.
+   - A detailed `meta_prompt` is used to instruct Grok to return a JSON object containing 280-character tweet-sized responses.
    - Each paragraph is required to include a character count in square brackets (e.g., `[274]`).
-   - These responses are streamed and parsed using `ast.literal_eval` to ensure safe dictionary parsing.
+   - These responses are streamed and parsed with `jiter`, a fast JSON parser that caches repeated keys.
 
 4. **Text Cleaning**:
    - Removes `[char_count]` annotations and excess whitespace from Grok's output before publishing.
 
 5. **Tweet Posting (via Tweepy)**:
-   - Uses Tweepy to post each paragraph as a separate tweet.
+   - Uses Tweepy's asyncio `AsyncClient` to post each paragraph as a separate tweet.
    - Each tweet is cached based on content to prevent re-posting identical tweets.
+   - Over-length paragraphs are trimmed locally to 280 characters (at a sentence boundary when
+     possible) instead of being rejected by X after a round-trip.
+   - Tweets are paced to at most one per second; on HTTP 429 the bot waits for `x-rate-limit-reset`
+     and retries instead of dropping the paragraph.
 
 6. **Telegram Integration (Optional)**:
-   - If Telegram is configured, the same tweet text is also sent to a configured chat via Telegram's bot API.
+   - If Telegram is configured, the cleaned paragraphs are joined and sent to a configured chat via
+     Telegram's bot API as few messages as the 4096-character limit allows (usually one), over a
+     single shared `aiohttp` session.
+   - The same pooled keep-alive session is handed to Tweepy, so X and Telegram posts reuse open TLS
+     connections instead of paying a handshake per request.
 
 7. **Broadcast Loop**:
    - The `process_and_broadcast` method:
      - Accepts a user prompt (e.g., a market sector query).
      - Queries Grok with the structured meta prompt.
-     - Cleans and posts each paragraph to Twitter and Telegram.
+     - Cleans and posts each paragraph as a tweet and the batched paragraphs to Telegram, running all posts
+       concurrently with `asyncio.gather`.
      - Returns a mapping of tweet and Telegram response metadata for each paragraph.
 
-8. **Time-Based Scheduling (via `schedule`)**:
-   - Predefined prompts are triggered at exact HH:MM:SS times using `schedule.every().day.at(...).do(...)`.
+8. **Time-Based Scheduling (via `asyncio`)**:
+   - The HH:MM:SS slots are parsed once at startup into a heap of next-run datetimes; a single
+     asyncio loop sleeps until the earliest (re-checking at least once a minute), starts its
+     broadcast and pushes that slot back exactly one day later.
    - Prompts cover Indian financial market sectors in rotation every 3 hours.
-   - A loop runs every second checking if a scheduled job is due.
+   - Broadcasts run as their own tasks, so a slow Grok/X/Telegram round never delays another slot.
 
 Usage:
 ------
@@ -51,20 +70,29 @@ Usage:
 - Ideal for automated content pipelines in fin-news dissemination, alerting, or thematic channels.
 """
 import os
-import ast
-import json
+import asyncio
+import heapq
 import logging
+import queue
+import re
+import signal
+import sqlite3
 import time
 import datetime as dt
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from threading import RLock
-from typing import Dict, Any, Optional
-
-import regex as re
-import schedule
+from threading import Event, Lock, Thread
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+import aiohttp
+import jiter
+import orjson
+import zstandard as zstd
+from blake3 import blake3
 import tweepy
-import requests
 from dotenv import load_dotenv
+from tweepy.asynchronous import AsyncClient
 from xai_sdk import Client
 from xai_sdk.chat import user, system
 from xai_sdk.search import SearchParameters
@@ -81,25 +109,119 @@ _handler = logging.StreamHandler()
 _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s - %(message)s"))
 logger.addHandler(_handler)
 
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """Credentials and endpoints read from the environment."""
+
+    LLM_API_KEY: Optional[str]
+    LLM_API_HOST: Optional[str]
+    API_KEY_X: Optional[str]
+    API_KEY_SECRET_X: Optional[str]
+    ACCESS_TOKEN_X: Optional[str]
+    ACCESS_TOKEN_SECRET_X: Optional[str]
+    TELEGRAM_BOT_TOKEN: Optional[str]
+    TELEGRAM_CHAT_ID: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> Env:
+    return Env(**{f.name: os.getenv(f.name) for f in fields(Env)})
+
+
+# -------------------------------------------------------------
+# SQLite key/value cache ----------------------------------------
+# -------------------------------------------------------------
+
+CACHE_FILE = Path("tweet_cache.sqlite")
+LEGACY_CACHE_FILE = Path("tweet_cache.json")
+CACHE_LOCK = Lock()
+CACHE_KEY_DIGEST = 16  # hex chars of the blake3 digest kept per key
+CACHE_SHARDS = 16  # in-memory lock stripes
+CACHE_COMPRESS_MIN = 512  # bytes of JSON before a value is worth compressing
+CACHE_ZSTD_LEVEL = 3
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _encode_value(value: Any, cctx: zstd.ZstdCompressor) -> Any:
+    """Serialise a cache value: compact JSON text, or a zstd blob when large."""
+    data = orjson.dumps(value)
+    if len(data) < CACHE_COMPRESS_MIN:
+        return data.decode()
+    return cctx.compress(data)
+
+
+def _decode_value(raw: Any, dctx: zstd.ZstdDecompressor) -> Any:
+    if isinstance(raw, bytes) and raw.startswith(_ZSTD_MAGIC):
+        raw = dctx.decompress(raw)
+    return orjson.loads(raw)
+
+
+def _cache_key(kind: str, *parts: str) -> str:
+    """Content-addressed key, e.g. ``tweet:3f9a…`` for the given text."""
+    digest = blake3("\x00".join(parts).encode()).hexdigest()[:CACHE_KEY_DIGEST]
+    return f"{kind}:{digest}"
+
+
+def _rekey_legacy(key: str) -> str:
+    """Map a raw ``kind::text`` (or ``grok::model::prompt``) key to its hashed form."""
+    kind, _, rest = key.partition("::")
+    if kind == "grok":
+        model, _, prompt = rest.partition("::")
+        return _cache_key(kind, model, prompt)
+    return _cache_key(kind, rest)
+
+
+def _open_cache() -> sqlite3.Connection:
+    """Open (or create) the cache database, migrating legacy entries once."""
+    db = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+    if LEGACY_CACHE_FILE.exists():
+        legacy = orjson.loads(LEGACY_CACHE_FILE.read_bytes())
+        cctx = zstd.ZstdCompressor(level=CACHE_ZSTD_LEVEL)
+        with db:
+            db.executemany(
+                "INSERT OR IGNORE INTO kv VALUES (?, ?)",
+                ((k, _encode_value(v, cctx)) for k, v in legacy.items()),
+            )
+        LEGACY_CACHE_FILE.rename(LEGACY_CACHE_FILE.with_suffix(".json.migrated"))
+        logger.info("Imported %d legacy cache entries into %s", len(legacy), CACHE_FILE)
+    raw = db.execute("SELECT key, value FROM kv WHERE key LIKE '%::%'").fetchall()
+    if raw:
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO kv VALUES (?, ?)",
+                ((_rekey_legacy(k), v) for k, v in raw),
+            )
+            db.executemany("DELETE FROM kv WHERE key = ?", ((k,) for k, _ in raw))
+        logger.info("Re-keyed %d cache entries to content hashes.", len(raw))
+    return db
+
+
 # -------------------------------------------------------------
-# Simple JSON cache (thread‑safe) --------------------------------
+# Text cleaning patterns -----------------------------------------
 # -------------------------------------------------------------
 
-CACHE_FILE = Path("tweet_cache.json")
-CACHE_LOCK = RLock()
+# Trailing "[274]" char-count marker, or whitespace before punctuation; both are dropped.
+_RE_CLEAN = re.compile(r"\s*\[\d{1,3}\]$|\s+(?=[.,;!?])")
 
 
-def _load_cache() -> Dict[str, Any]:
-    """Load cache from disk or create the file atomically."""
-    with CACHE_LOCK:
-        if not CACHE_FILE.exists():
-            CACHE_FILE.write_text("{}", encoding="utf-8")
-        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+# -------------------------------------------------------------
+# HTTP & posting settings (X / Telegram) ------------------------
+# -------------------------------------------------------------
 
+TELEGRAM_TIMEOUT = aiohttp.ClientTimeout(total=10)
+TELEGRAM_MAX_CHARS = 4096  # Bot API sendMessage text limit
+HTTP_POOL_SIZE = 16  # total keep-alive connections shared by X and Telegram
+HTTP_POOL_PER_HOST = 8
 
-def _save_cache(cache: Dict[str, Any]):
-    with CACHE_LOCK:
-        CACHE_FILE.write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding="utf-8")
+TWEET_MAX_CHARS = 280
+TWEET_MIN_INTERVAL = 1.0  # seconds between consecutive create_tweet calls
+TWEET_RATE_LIMIT_RETRIES = 2
+TWEET_MAX_RESET_WAIT = 15 * 60  # give up rather than wait out longer (e.g. daily) limits
 
 
 # =============================================================
@@ -114,30 +236,36 @@ class GrokTweetBot:
     # ──────────────────────────────────────────────────────────
 
     def __init__(self):
-        self._load_env()
+        self.env = _load_env()
         self._validate_env()
 
         # Grok / xAI client
         self.grok_client = (
-            Client(api_key=self.LLM_API_KEY, api_host=self.LLM_API_HOST)
-            if self.LLM_API_HOST
-            else Client(api_key=self.LLM_API_KEY)
+            Client(api_key=self.env.LLM_API_KEY, api_host=self.env.LLM_API_HOST)
+            if self.env.LLM_API_HOST
+            else Client(api_key=self.env.LLM_API_KEY)
         )
 
         # Twitter (X) client
-        self.twitter_client = tweepy.Client(
-            consumer_key=self.API_KEY_X,
-            consumer_secret=self.API_KEY_SECRET_X,
-            access_token=self.ACCESS_TOKEN_X,
-            access_token_secret=self.ACCESS_TOKEN_SECRET_X,
+        self.twitter_client = AsyncClient(
+            consumer_key=self.env.API_KEY_X,
+            consumer_secret=self.env.API_KEY_SECRET_X,
+            access_token=self.env.ACCESS_TOKEN_X,
+            access_token_secret=self.env.ACCESS_TOKEN_SECRET_X,
         )
 
         # Telegram endpoint (optional)
         self.telegram_api_url: Optional[str] = (
-            f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
-            if self.TELEGRAM_BOT_TOKEN
+            f"https://api.telegram.org/bot{self.env.TELEGRAM_BOT_TOKEN}/sendMessage"
+            if self.env.TELEGRAM_BOT_TOKEN
             else None
         )
+        # Shared pooled HTTP session, created lazily on the event loop that uses it
+        self._http: Optional[aiohttp.ClientSession] = None
+        # Tweet pacing state; the lock also keeps tweets in submission order
+        self._tweet_lock = asyncio.Lock()
+        self._last_tweet_at = 0.0
+        self._rate_limited_until = 0.0  # epoch seconds of the last known X reset
 
         # Prompt that forces Grok to produce tweet‑sized paragraphs with counts
         self.meta_prompt = (
@@ -148,67 +276,131 @@ class GrokTweetBot:
             "2. Character Count Verification\n"
             "- After composing each paragraph, append its character count in square brackets, e.g. [274].\n"
             "- Do not exceed 280 characters; adjust wording if necessary.\n\n"
-            "3. Dictionary Output\n"
-            "- Once all paragraphs are finalized, output only a Python-style dictionary:\n"
+            "3. JSON Output\n"
+            "- Once all paragraphs are finalized, output only a JSON object:\n"
             "    {\n"
-            "    1: \"First paragraph text…\",\n"
-            "    2: \"Second paragraph text…\",\n"
+            "    \"1\": \"First paragraph text…\",\n"
+            "    \"2\": \"Second paragraph text…\",\n"
             "    …\n"
-            "    n: \"Nth paragraph text…\"\n"
+            "    \"n\": \"Nth paragraph text…\"\n"
             "    }\n"
             "- No additional commentary, markdown, or logging.\n\n"
             "4. Exact Formatting\n"
             "- Use straight quotes (\") only. No escape characters beyond JSON necessities.\n"
-            "- Keys consecutive integers starting at 1. No trailing commas.\n\n"
+            "- Keys are consecutive integers as strings, starting at \"1\". No trailing commas.\n\n"
             "5. Content Requirements\n"
             "- Be specific and factual. Logical flow: intro, development, conclusion.\n"
             "- Avoid filler words; every sentence must add value.\n"""
         )
 
-        # Populate cache into memory once
-        self.cache: Dict[str, Any] = _load_cache()
+        # Persistent key/value cache, mirrored in memory and flushed in the background
+        self._db = _open_cache()
+        # Each shard is (entries, writes not yet committed to the flusher, lock)
+        self._shards: List[Tuple[Dict[str, Any], Dict[str, Any], Lock]] = [
+            ({}, {}, Lock()) for _ in range(CACHE_SHARDS)
+        ]
+        dctx = zstd.ZstdDecompressor()
+        for k, v in self._db.execute("SELECT key, value FROM kv"):
+            self._shards[hash(k) % CACHE_SHARDS][0][k] = _decode_value(v, dctx)
+        self._dirty: "queue.Queue[List[Tuple[str, Any]]]" = queue.Queue()
+        self._stop = Event()
+        self._flusher = Thread(target=self._flush_loop, name="cache-flusher", daemon=True)
+        self._flusher.start()
 
     # ──────────────────────────────────────────────────────────
     # Environment helpers
     # ──────────────────────────────────────────────────────────
 
-    def _load_env(self):
-        self.LLM_API_KEY = os.getenv("LLM_API_KEY")
-        self.LLM_API_HOST = os.getenv("LLM_API_HOST")
-        self.API_KEY_X = os.getenv("API_KEY_X")
-        self.API_KEY_SECRET_X = os.getenv("API_KEY_SECRET_X")
-        self.ACCESS_TOKEN_X = os.getenv("ACCESS_TOKEN_X")
-        self.ACCESS_TOKEN_SECRET_X = os.getenv("ACCESS_TOKEN_SECRET_X")
-        self.TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
-
     def _validate_env(self):
         required = [
-            self.LLM_API_KEY,
-            self.API_KEY_X,
-            self.API_KEY_SECRET_X,
-            self.ACCESS_TOKEN_X,
-            self.ACCESS_TOKEN_SECRET_X,
+            self.env.LLM_API_KEY,
+            self.env.API_KEY_X,
+            self.env.API_KEY_SECRET_X,
+            self.env.ACCESS_TOKEN_X,
+            self.env.ACCESS_TOKEN_SECRET_X,
         ]
         if any(v is None for v in required):
             raise EnvironmentError("Missing mandatory Twitter/xAI environment variables.")
 
         # Telegram is optional, but if one is provided both must exist.
-        if bool(self.TELEGRAM_BOT_TOKEN) ^ bool(self.TELEGRAM_CHAT_ID):
+        if bool(self.env.TELEGRAM_BOT_TOKEN) ^ bool(self.env.TELEGRAM_CHAT_ID):
             raise EnvironmentError(
                 "Provide *both* TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID, or neither."
             )
 
+    # ──────────────────────────────────────────────────────────
+    # Cache helpers
+    # ──────────────────────────────────────────────────────────
+
+    # Reads are a single lock-free dict lookup. Writers lock only their key's
+    # shard, so on free-threaded builds concurrent posts rarely contend;
+    # CACHE_LOCK only guards the flusher's database writes.
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        return self._shards[hash(key) % CACHE_SHARDS][0].get(key)
+
+    def _cache_put(self, key: str, value: Any):
+        shard, pending, lock = self._shards[hash(key) % CACHE_SHARDS]
+        with lock:
+            shard[key] = value
+            pending[key] = value
+
+    def _commit_pending(self):
+        """Hand every write since the last commit to the flusher as one batch."""
+        batch: List[Tuple[str, Any]] = []
+        for _shard, pending, lock in self._shards:
+            with lock:
+                batch += pending.items()
+                pending.clear()
+        if batch:
+            self._dirty.put(batch)
+
+    def _flush_loop(self):
+        """Persist queued batches, one transaction per drain, until stopped."""
+        # zstd compressors must not be shared across threads; each flusher owns one.
+        cctx = zstd.ZstdCompressor(level=CACHE_ZSTD_LEVEL)
+        while not (self._stop.is_set() and self._dirty.empty()):
+            try:
+                batch = self._dirty.get(timeout=1)
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    batch += self._dirty.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                with CACHE_LOCK, self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO kv VALUES (?, ?)",
+                        [(k, _encode_value(v, cctx)) for k, v in batch],
+                    )
+            except Exception:  # keep flushing later batches; a dead flusher loses every write
+                logger.exception("Failed to persist %d cache entries.", len(batch))
+
+    def close(self):
+        """Flush pending cache writes and release the database."""
+        self._commit_pending()
+        self._stop.set()
+        self._flusher.join()
+        self._db.close()
+
+    async def aclose(self):
+        """Close the HTTP session, then flush and close the cache."""
+        if self._http is not None:
+            await self._http.close()
+        await asyncio.to_thread(self.close)
+
     # ──────────────────────────────────────────────────────────
     # Utility helpers
     # ──────────────────────────────────────────────────────────
 
     def _query_grok(
         self, user_prompt: str, model: str = "grok-4", temperature: float = 0.0
-    ) -> Dict[int, str]:
+    ) -> Dict[str, str]:
         """Ask Grok; cache the structured dict so we never re‑query for same prompt."""
-        cache_key = f"grok::{model}::{user_prompt}"
-        if (cached := self.cache.get(cache_key)) is not None:
+        cache_key = _cache_key("grok", model, user_prompt)
+        if (cached := self._cache_get(cache_key)) is not None:
             logger.info("Grok cache hit for prompt → %s", user_prompt[:60])
             return cached
 
@@ -219,61 +411,110 @@ class GrokTweetBot:
                 messages=[system(self.meta_prompt), user(user_prompt)],
                 search_parameters=SearchParameters(mode="auto"),
             )
-            chunks: List[str] = []
+            buf = bytearray()
             for _resp, chunk in chat.stream():
-                chunks.append(chunk.content)
-            parsed = ast.literal_eval("".join(chunks))
+                buf += chunk.content.encode()
+            parsed = jiter.from_json(bytes(buf), cache_mode="all")
         except Exception:
             logger.exception("Failed Grok query or parsing.")
             raise
 
-        self.cache[cache_key] = parsed
-        _save_cache(self.cache)
+        self._cache_put(cache_key, parsed)
         return parsed
 
     @staticmethod
     def _clean_text(text: str) -> str:
         """Remove trailing [char_count] markers and redundant whitespace."""
-        text = re.sub(r"\s*\[\d{1,3}\]$", "", text.strip())
-        text = re.sub(r"\s*([.,;!?])", r"\1", text)
-        return text.strip()
+        return _RE_CLEAN.sub("", text.strip()).strip()
 
     # ---------------------------------------------------------
     # Posting helpers
     # ---------------------------------------------------------
 
-    def _post_tweet(self, text: str) -> Optional[Dict[str, Any]]:
-        cache_key = f"tweet::{text}"
-        if (cached := self.cache.get(cache_key)) is not None:
+    def _session(self) -> aiohttp.ClientSession:
+        if self._http is None:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_PER_HOST, ttl_dns_cache=300
+            )
+            self._http = aiohttp.ClientSession(connector=connector)
+            # Tweepy opens (and closes) a fresh session per request unless one is supplied.
+            self.twitter_client.session = self._http
+        return self._http
+
+    @staticmethod
+    def _fit_tweet(text: str) -> str:
+        """Trim to 280 chars, at the last sentence end if one falls in the back half.
+
+        Only a plain code-point limit is enforced, not X's weighted length (URLs,
+        CJK and emoji count extra), so the fallback uses an ASCII "..." rather
+        than "…", which X weighs as two.
+        """
+        if len(text) <= TWEET_MAX_CHARS:
+            return text
+        head = text[: TWEET_MAX_CHARS + 1]  # a sentence may end exactly at the limit
+        cut = max(head.rfind(". "), head.rfind("! "), head.rfind("? "))
+        if cut >= TWEET_MAX_CHARS // 2:
+            return head[: cut + 1]
+        return text[: TWEET_MAX_CHARS - 3].rstrip() + "..."
+
+    async def _post_tweet(self, text: str) -> Optional[Dict[str, Any]]:
+        if len(text) > TWEET_MAX_CHARS:
+            logger.warning("Paragraph is %d chars; trimming to fit a tweet.", len(text))
+            text = self._fit_tweet(text)
+        cache_key = _cache_key("tweet", text)
+        if (cached := self._cache_get(cache_key)) is not None:
             logger.info("Tweet cache hit → skipping X post.")
             return cached
-        try:
-            response = self.twitter_client.create_tweet(text=text)
-            self.cache[cache_key] = response.data
-            _save_cache(self.cache)
-            logger.info("Tweet posted: %s", response.data)
-            return response.data
-        except tweepy.TweepyException as exc:
-            logger.error("Tweet failed: %s", exc)
-            return None
-
-    def _post_telegram(self, text: str) -> Optional[Dict[str, Any]]:
+        self._session()
+        # Waits (pacing and rate-limit resets) happen under the lock, so one 429
+        # pauses every queued tweet and they resume in submission order.
+        async with self._tweet_lock:
+            for attempt in range(TWEET_RATE_LIMIT_RETRIES + 1):
+                wait = max(
+                    TWEET_MIN_INTERVAL - (time.monotonic() - self._last_tweet_at),
+                    self._rate_limited_until - time.time(),
+                )
+                if wait > TWEET_MAX_RESET_WAIT:
+                    logger.error("X rate limit resets in %.0fs; skipping tweet.", wait)
+                    return None
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    response = await self.twitter_client.create_tweet(text=text)
+                except tweepy.TooManyRequests as exc:
+                    reset = exc.response.headers.get("x-rate-limit-reset")
+                    self._rate_limited_until = (
+                        int(reset) + 1 if reset else time.time() + TWEET_MIN_INTERVAL
+                    )
+                    logger.warning("Tweet rate-limited (attempt %d): %s", attempt + 1, exc)
+                    continue
+                except tweepy.TweepyException as exc:
+                    logger.error("Tweet failed: %s", exc)
+                    return None
+                finally:
+                    self._last_tweet_at = time.monotonic()
+                self._cache_put(cache_key, response.data)
+                logger.info("Tweet posted: %s", response.data)
+                return response.data
+        logger.error("Tweet still rate-limited after %d attempts; giving up.", attempt + 1)
+        return None
+
+    async def _post_telegram(self, text: str) -> Optional[Dict[str, Any]]:
         if not self.telegram_api_url:
             return None  # Telegram not configured
-        cache_key = f"telegram::{text}"
-        if (cached := self.cache.get(cache_key)) is not None:
+        cache_key = _cache_key("telegram", text)
+        if (cached := self._cache_get(cache_key)) is not None:
             logger.info("Telegram cache hit → skipping Telegram post.")
             return cached
         try:
-            resp = requests.post(
+            async with self._session().post(
                 self.telegram_api_url,
-                data={"chat_id": self.TELEGRAM_CHAT_ID, "text": text},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            self.cache[cache_key] = data
-            _save_cache(self.cache)
+                json={"chat_id": self.env.TELEGRAM_CHAT_ID, "text": text},
+                timeout=TELEGRAM_TIMEOUT,
+            ) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+            self._cache_put(cache_key, data)
             logger.info("Telegram message sent: message_id=%s", data.get("result", {}).get("message_id"))
             return data
         except Exception as exc:
@@ -284,18 +525,52 @@ class GrokTweetBot:
     # Public API
     # ---------------------------------------------------------
 
-    def process_and_broadcast(self, user_prompt: str):
+    @staticmethod
+    def _pack_telegram(paragraphs: Dict[str, str]) -> List[Tuple[str, List[str]]]:
+        """Join paragraphs into as few ≤4096-char messages as possible, keeping their order."""
+        batches: List[Tuple[str, List[str]]] = []
+        text, keys = "", []
+        for idx, para in paragraphs.items():
+            para = para[:TELEGRAM_MAX_CHARS]
+            if text and len(text) + 2 + len(para) > TELEGRAM_MAX_CHARS:
+                batches.append((text, keys))
+                text, keys = "", []
+            text = f"{text}\n\n{para}" if text else para
+            keys.append(idx)
+        if text:
+            batches.append((text, keys))
+        return batches
+
+    async def process_and_broadcast(self, user_prompt: str):
         """End‑to‑end: query Grok → clean → post to X & Telegram."""
         logger.info("Processing prompt: %s", user_prompt)
-        paragraphs = self._query_grok(user_prompt)
-        results: Dict[int, Dict[str, Any]] = {}
-
-        for idx, para in paragraphs.items():
-            clean_text = self._clean_text(para)
-            tweet_res = self._post_tweet(clean_text)
-            tel_res = self._post_telegram(clean_text)
-            results[idx] = {"tweet": tweet_res, "telegram": tel_res}
-
+        try:
+            return await self._broadcast(user_prompt)
+        finally:
+            # Persist the Grok reply and every post from this round in one write.
+            self._commit_pending()
+
+    async def _broadcast(self, user_prompt: str) -> Dict[str, Dict[str, Any]]:
+        paragraphs = await asyncio.to_thread(self._query_grok, user_prompt)
+        cleaned = {idx: self._clean_text(para) for idx, para in paragraphs.items()}
+
+        # One tweet per paragraph (280-char cap), but Telegram gets them batched.
+        # Batches are sent in order so the chat reads top to bottom.
+        async def post_telegram_batches() -> Dict[str, Any]:
+            sent: Dict[str, Any] = {}
+            for text, keys in self._pack_telegram(cleaned):
+                res = await self._post_telegram(text)
+                sent.update(dict.fromkeys(keys, res))
+            return sent
+
+        tweet_res, tel_res = await asyncio.gather(
+            asyncio.gather(*(self._post_tweet(text) for text in cleaned.values())),
+            post_telegram_batches(),
+        )
+        results: Dict[str, Dict[str, Any]] = {
+            idx: {"tweet": tweet, "telegram": tel_res.get(idx)}
+            for idx, tweet in zip(cleaned, tweet_res)
+        }
         return results
 
 
@@ -303,6 +578,9 @@ class GrokTweetBot:
 # Scheduling ---------------------------------------------------
 # =============================================================
 
+SCHEDULER_MAX_SLEEP = 60.0  # seconds; bounds drift if the wall clock jumps
+ONE_DAY = dt.timedelta(days=1)
+
 user_prompts: Dict[str, str] = {
     "09:00:00": "What’s the latest on Financials in the Indian financial markets?",
     "12:00:00": "What’s the latest on Energy & Utilities in the Indian financial markets?",
@@ -315,22 +593,68 @@ user_prompts: Dict[str, str] = {
 }
 
 
-def _schedule_jobs(bot: GrokTweetBot):
-    for hhmm, prompt in user_prompts.items():
-        schedule.every().day.at(hhmm).do(bot.process_and_broadcast, user_prompt=prompt)
-        logger.info("Scheduled job at %s for prompt: %s", hhmm, prompt[:60])
+def _first_runs() -> List[Tuple[dt.datetime, str]]:
+    """Heap of ``(next local run, prompt)``, parsing each HH:MM:SS slot once."""
+    now = dt.datetime.now()
+    runs = []
+    for hhmmss, prompt in user_prompts.items():
+        due = dt.datetime.combine(now.date(), dt.time.fromisoformat(hhmmss))
+        if due <= now:
+            due += ONE_DAY
+        runs.append((due, prompt))
+        logger.info("Scheduled job at %s for prompt: %s", hhmmss, prompt[:60])
+    heapq.heapify(runs)
+    return runs
+
+
+def _spawn_broadcast(bot: GrokTweetBot, prompt: str, running: Set[asyncio.Task]):
+    task = asyncio.create_task(bot.process_and_broadcast(prompt))
+    running.add(task)
+
+    def _report(t: asyncio.Task):
+        running.discard(t)
+        if not t.cancelled() and (exc := t.exception()) is not None:
+            logger.error("Broadcast failed for prompt %s: %s", prompt[:60], exc)
+
+    task.add_done_callback(_report)
+
+
+async def _run_scheduler(bot: GrokTweetBot):
+    # SIGTERM (e.g. `docker stop`) cancels us like Ctrl+C, so the cache still gets flushed.
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:  # event loops without signal support (Windows)
+        pass
+    runs = _first_runs()
+    running: Set[asyncio.Task] = set()
+    try:
+        while True:
+            due, prompt = runs[0]
+            now = dt.datetime.now()
+            if (delay := (due - now).total_seconds()) > 0:
+                await asyncio.sleep(min(delay, SCHEDULER_MAX_SLEEP))
+                continue
+            next_due = due + ONE_DAY
+            while next_due <= now:  # skip slots missed while suspended
+                next_due += ONE_DAY
+            heapq.heapreplace(runs, (next_due, prompt))
+            _spawn_broadcast(bot, prompt, running)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        await bot.aclose()
 
 
 def main():
     bot = GrokTweetBot()
-    _schedule_jobs(bot)
     logger.info("Scheduler started. Press Ctrl+C to exit.")
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        asyncio.run(_run_scheduler(bot))
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user.")
+    except asyncio.CancelledError:
+        logger.info("Scheduler stopped by SIGTERM.")
 
 
 if __name__ == "__main__":